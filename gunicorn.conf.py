@@ -0,0 +1,34 @@
+import os
+
+bind = "0.0.0.0:" + os.environ.get("PORT", "8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+
+# Load Django once in the master so forked workers start with the app imported
+preload_app = True
+
+
+def when_ready(server):
+    # Runs in the master before any worker is forked. With the app preloaded,
+    # the DB-independent warmup (URL resolver, templates) is done once here
+    # and shared with the workers copy-on-write.
+    if not server.cfg.preload_app:
+        return
+
+    from tasks.warmup import SHARED_STEPS, warm_up
+
+    timings = warm_up(SHARED_STEPS)
+    server.log.info("Shared warmup done: %s", timings)
+
+
+def post_worker_init(worker):
+    # Runs in each worker after fork, before it accepts requests. Opens the
+    # worker's own DB connection, plus anything the master didn't warm.
+    # Failures are recorded and retried by /readyz rather than raised, so a
+    # DB blip never stops the worker from booting.
+    from tasks.warmup import warm_up, warmup_errors
+
+    timings = warm_up()
+    worker.log.info("Worker %s warmed up: %s", worker.pid, timings)
+    errors = warmup_errors()
+    if errors:
+        worker.log.warning("Worker %s warmup failed: %s", worker.pid, errors)
@@ -0,0 +1,67 @@
+"""
+Measure how long a fresh process takes to serve its first page.
+
+    python scripts/measure_startup.py               # warm up, then request
+    python scripts/measure_startup.py --no-warmup   # cold first request
+
+Compare the "first" request time between the two runs to see what the
+gunicorn warmup saves.
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+started = time.perf_counter()
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "daily_task_review.settings")
+
+PAGE = "/accounts/login/"
+
+
+def elapsed_ms(since):
+    return round((time.perf_counter() - since) * 1000, 2)
+
+
+def report(label, ms, note=""):
+    print(f"{label + ':':<26}{ms:>9} ms {note}".rstrip())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--no-warmup",
+        action="store_true",
+        help="Skip warm_up() to measure a cold first request",
+    )
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        sys.exit("DATABASE_URL is not set; point it at the database to measure against.")
+
+    step = time.perf_counter()
+    from django.core.wsgi import get_wsgi_application
+    get_wsgi_application()
+    report("app load", elapsed_ms(step))
+
+    if not args.no_warmup:
+        from tasks.warmup import warm_up, warmup_errors
+        for name, ms in warm_up().items():
+            report(f"warmup {name}", ms)
+        for name, error in warmup_errors().items():
+            print(f"warmup {name} failed: {error}")
+
+    from django.test import Client
+    client = Client()
+    for attempt in ("first", "second"):
+        step = time.perf_counter()
+        response = client.get(PAGE)
+        report(f"{attempt} {PAGE}", elapsed_ms(step), f"({response.status_code})")
+
+    report("total", elapsed_ms(started))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,41 @@
+from unittest import mock
+from django.db.utils import OperationalError
 from django.test import TestCase
+from . import warmup
 
-# Create your tests here.
+
+class HealthCheckTests(TestCase):
+    def setUp(self):
+        warmup._state["done"] = set()
+        warmup._state["errors"] = {}
+
+    def test_healthz_ok(self):
+        response = self.client.get("/healthz")
+        self.assertEqual(response.status_code, 200)
+
+    def test_readyz_before_and_after_warmup(self):
+        response = self.client.get("/readyz")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json(), {"warm": False})
+
+        warmup.warm_up()
+
+        response = self.client.get("/readyz")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"warm": True})
+
+    def test_readyz_failed_warmup_step(self):
+        broken = mock.Mock()
+        broken.ensure_connection.side_effect = OperationalError("db down")
+
+        with mock.patch.object(warmup, "connection", broken):
+            warmup.warm_up()
+            response = self.client.get("/readyz")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json(), {"warm": False, "failed_steps": ["db_connection"]})
+
+        # The next probe retries the failed step once the DB is back
+        response = self.client.get("/readyz")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"warm": True})
@@ -15,4 +15,8 @@ urlpatterns = [
     path("set-active/<int:day_id>/", views.set_active_day_view, name="set_active_day"),
     path("close-active/", views.close_active_day_view, name="close_active_day"),
     path('accounts/signup/', signup_view, name='signup'),
+
+    # health checks
+    path("healthz", views.healthz_view, name="healthz"),
+    path("readyz", views.readyz_view, name="readyz"),
 ]
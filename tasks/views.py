@@ -3,10 +3,12 @@ from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_POST
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth import login
+from django.http import HttpResponse, JsonResponse
 from .models import TaskStatus, Day
 from .services import get_active_day, get_open_days, set_active_day, \
     create_task, toggle_task_status, delete_task, \
     close_active_day_and_open_next
+from .warmup import is_warm, warm_up, warmup_errors
 from django.shortcuts import render, redirect, get_object_or_404
 
 
@@ -138,3 +140,26 @@ def account_view(request):
     return render(request, "tasks/account.html", {
         "user": user,
     })
+
+
+def healthz_view(request):
+    """
+    Liveness: the process is up and serving requests
+    """
+    return HttpResponse("ok", content_type="text/plain")
+
+
+def readyz_view(request):
+    """
+    Readiness: this worker has finished warming up. Failed warmup
+    steps (e.g. the DB was unreachable at boot) are retried here.
+    """
+    if warmup_errors():
+        warm_up()
+
+    warm = is_warm()
+    body = {"warm": warm}
+    errors = warmup_errors()
+    if errors:
+        body["failed_steps"] = sorted(errors)
+    return JsonResponse(body, status=200 if warm else 503)
@@ -0,0 +1,88 @@
+import logging
+import time
+from django.db import connection
+from django.template.loader import get_template
+from django.urls import get_resolver, reverse
+from .models import Day
+
+logger = logging.getLogger(__name__)
+
+WARM_TEMPLATES = [
+    "base.html",
+    "registration/login.html",
+    "tasks/today.html",
+    "tasks/day.html",
+    "tasks/sidebar.html",
+]
+
+_state = {"done": set(), "errors": {}}
+
+
+def _resolve_urls():
+    get_resolver().url_patterns
+    reverse("today")
+
+
+def _compile_templates():
+    for name in WARM_TEMPLATES:
+        get_template(name)
+
+
+def _open_db_connection():
+    connection.ensure_connection()
+
+
+def _query_active_day():
+    # Same shape as get_active_day(), without needing a user
+    Day.objects.filter(is_active=True).first()
+
+
+# Don't touch the DB, so they can run once in the gunicorn master
+SHARED_STEPS = [
+    ("urls", _resolve_urls),
+    ("templates", _compile_templates),
+]
+
+# Need a connection of their own, so they run in every worker
+WORKER_STEPS = [
+    ("db_connection", _open_db_connection),
+    ("active_day_query", _query_active_day),
+]
+
+WARMUP_STEPS = SHARED_STEPS + WORKER_STEPS
+
+
+def warm_up(steps=WARMUP_STEPS):
+    """
+    Pay the first-request costs up front (URL resolver, template
+    compilation, DB connection). Steps that already succeeded are
+    skipped; a failing step is logged and retried on the next call.
+    Returns the time spent on each step that ran, in milliseconds.
+    """
+    timings = {}
+    for name, step in steps:
+        if name in _state["done"]:
+            continue
+
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception as exc:
+            logger.exception("Warmup step %s failed", name)
+            _state["errors"][name] = repr(exc)
+            continue
+        finally:
+            timings[name] = round((time.perf_counter() - started) * 1000, 2)
+
+        _state["done"].add(name)
+        _state["errors"].pop(name, None)
+
+    return timings
+
+
+def is_warm():
+    return all(name in _state["done"] for name, _ in WARMUP_STEPS)
+
+
+def warmup_errors():
+    return dict(_state["errors"])